@@ -8,14 +8,50 @@ This configures:
 - Custom fixtures for test organization
 """
 
+import functools
 import os
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Generator, List
 from playwright.sync_api import Page, BrowserContext, Playwright, Browser
 
 # Well-known attribute name for QAStudio reporter to find attachments
 QASTUDIO_ATTACHMENTS_ATTR = "_qastudio_attachments"
 
+# Node attribute holding (path, future) for a screenshot still being written
+SCREENSHOT_WRITE_ATTR = "_qastudio_screenshot_write"
+
+# Maps characters that are awkward in file names (from parametrize ids) to "_"
+_NAME_TRANS = str.maketrans({"[": "_", "]": "_"})
+
+# Node attribute for each test phase's report (read by the fixtures)
+_REP_ATTRS = {"setup": "rep_setup", "call": "rep_call", "teardown": "rep_teardown"}
+
+# Artifact directories live next to this file
+_BASE_DIR = os.path.dirname(__file__)
+
+# Writes artifact files in the background while teardown continues
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="artifact-writer")
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> None:
+    """Create a directory once per session instead of re-checking it for every test."""
+    # A single stat is enough when the directory already exists
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
+
+
+def pytest_addoption(parser):
+    """Register example-specific ini options."""
+    parser.addini(
+        "qastudio_always_attach_trace",
+        "Save and attach the Playwright trace for passing tests too (true/false)",
+        type="bool",
+        default=False,
+    )
+
 
 @pytest.fixture(scope="session")
 def browser_context_args(browser_context_args):
@@ -34,7 +70,12 @@ def context(
     pytestconfig,
     request,
 ) -> Generator[BrowserContext, None, None]:
-    """Create a new browser context for each test with tracing enabled."""
+    """
+    Create a new browser context for each test with tracing enabled.
+
+    The trace is only written to disk and attached when the test fails,
+    unless qastudio_always_attach_trace is enabled.
+    """
     context = browser.new_context(**browser_context_args)
 
     # Start tracing before creating the page
@@ -50,27 +91,48 @@ def context(
         pytestconfig._current_test_name if hasattr(pytestconfig, "_current_test_name") else "trace"
     )
 
-    # Always save trace file
-    trace_dir = os.path.join(os.path.dirname(__file__), "traces")
-    os.makedirs(trace_dir, exist_ok=True)
-    trace_path = os.path.join(trace_dir, f"{test_name}.zip")
-    context.tracing.stop(path=trace_path)
+    rep_call = getattr(request.node, "rep_call", None)
+    failed = rep_call is not None and rep_call.failed
 
-    # Add trace to attachments
-    if os.path.exists(trace_path):
-        attachments.append(os.path.abspath(trace_path))
+    if failed or pytestconfig.getini("qastudio_always_attach_trace"):
+        trace_dir = os.path.join(_BASE_DIR, "traces")
+        _ensure_dir(trace_dir)
+        trace_path = os.path.join(trace_dir, f"{test_name}.zip")
+        context.tracing.stop(path=trace_path)
 
-    # Store attachments as node attribute for QAStudio reporter
-    if attachments:
-        setattr(request.node, QASTUDIO_ATTACHMENTS_ATTR, attachments)
+        # Add trace to attachments
+        if os.path.exists(trace_path):
+            attachments.append(os.path.abspath(trace_path))
+    else:
+        # Passing test: discard the trace instead of writing a zip nobody looks at
+        context.tracing.stop()
 
     context.close()
 
+    # The page fixture hands its failure screenshot to the writer thread; the
+    # write overlapped with stopping the trace, so it is usually done by now.
+    # Wait for it here so the file exists before the reporter picks it up.
+    pending = getattr(request.node, SCREENSHOT_WRITE_ATTR, None)
+    if pending:
+        screenshot_path, write = pending
+        try:
+            write.result()
+            attachments.append(os.path.abspath(screenshot_path))
+        except Exception as e:
+            print(f"Failed to save screenshot: {e}")
+
+    # Store attachments as node attribute for QAStudio reporter
+    if attachments:
+        existing = getattr(request.node, QASTUDIO_ATTACHMENTS_ATTR, [])
+        existing.extend(attachments)
+        setattr(request.node, QASTUDIO_ATTACHMENTS_ATTR, existing)
+
 
 @pytest.fixture(scope="function", autouse=True)
 def setup_test_tracking(request, pytestconfig):
     """Track current test name for trace file naming."""
-    test_name = request.node.name.replace("[", "_").replace("]", "_")
+    test_name = request.node.name.translate(_NAME_TRANS)
+    request.node._qastudio_test_name = test_name
     pytestconfig._current_test_name = test_name
     yield
 
@@ -83,18 +145,18 @@ def page(context: BrowserContext, request) -> Generator[Page, None, None]:
 
     # Capture screenshot on test failure
     if request.node.rep_call and request.node.rep_call.failed:
-        screenshot_dir = os.path.join(os.path.dirname(__file__), "screenshots")
-        os.makedirs(screenshot_dir, exist_ok=True)
+        screenshot_dir = os.path.join(_BASE_DIR, "screenshots")
+        _ensure_dir(screenshot_dir)
 
-        test_name = request.node.name.replace("[", "_").replace("]", "_")
+        test_name = request.node._qastudio_test_name
         screenshot_path = os.path.join(screenshot_dir, f"{test_name}_failure.png")
 
         try:
-            page.screenshot(path=screenshot_path, full_page=True)
-            # Add screenshot to attachments
-            existing = getattr(request.node, QASTUDIO_ATTACHMENTS_ATTR, [])
-            existing.append(os.path.abspath(screenshot_path))
-            setattr(request.node, QASTUDIO_ATTACHMENTS_ATTR, existing)
+            # Capture in memory and write to disk in the background; the context
+            # fixture attaches the file once the write has finished
+            png = page.screenshot(full_page=True)
+            write = _executor.submit(Path(screenshot_path).write_bytes, png)
+            setattr(request.node, SCREENSHOT_WRITE_ATTR, (screenshot_path, write))
         except Exception as e:
             print(f"Failed to capture screenshot: {e}")
 
@@ -106,22 +168,24 @@ def pytest_runtest_makereport(item):
     """Store test result in item for screenshot capture."""
     outcome = yield
     rep = outcome.get_result()
-    setattr(item, f"rep_{rep.when}", rep)
+    item.__dict__[_REP_ATTRS[rep.when]] = rep
 
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_directories():
     """Create necessary directories for test artifacts."""
-    base_dir = os.path.dirname(__file__)
     directories = [
-        os.path.join(base_dir, "screenshots"),
-        os.path.join(base_dir, "traces"),
-        os.path.join(base_dir, "videos"),
+        os.path.join(_BASE_DIR, "screenshots"),
+        os.path.join(_BASE_DIR, "traces"),
+        os.path.join(_BASE_DIR, "videos"),
     ]
 
-    for directory in directories:
-        os.makedirs(directory, exist_ok=True)
+    # Create them in parallel so slow (e.g. network) filesystems overlap the round trips
+    list(_executor.map(_ensure_dir, directories))
 
     yield
 
+    # Make sure every background artifact write has reached the disk
+    _executor.shutdown(wait=True)
+
     # Cleanup is optional - leaving artifacts for review
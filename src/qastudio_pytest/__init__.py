@@ -8,6 +8,16 @@ __version__ = "1.0.6"
 __author__ = "QAStudio"
 __email__ = "support@qastudio.dev"
 
-from .plugin import QAStudioPlugin
+from typing import Any
 
 __all__ = ["QAStudioPlugin"]
+
+
+def __getattr__(name: str) -> Any:
+    # Importing the package must stay cheap: pytest loads it for every run via the
+    # entry point, but the reporter is only needed once an API key is configured
+    if name == "QAStudioPlugin":
+        from .reporter import QAStudioPlugin
+
+        return QAStudioPlugin
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
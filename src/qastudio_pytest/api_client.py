@@ -1,6 +1,10 @@
 """API client for QAStudio.dev integration."""
 
-from typing import Any, Dict, List, Optional
+import functools
+import gzip
+import json
+import threading
+from typing import Any, Callable, Dict, List, Optional
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -9,6 +13,58 @@ from .models import ReporterConfig, TestResult, TestRunSummary
 from .utils import sanitize_string
 
 
+def _encode_default(obj: Any) -> Any:
+    """Encode objects the JSON serializer does not handle natively."""
+    if isinstance(obj, TestResult):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+try:
+    import orjson
+
+    def _dumps(data: Any) -> bytes:
+        try:
+            # orjson serializes dataclasses natively; pass them through so TestResult
+            # goes through to_dict() like it does with stdlib json
+            return orjson.dumps(
+                data, default=_encode_default, option=orjson.OPT_PASSTHROUGH_DATACLASS
+            )
+        except TypeError:
+            # orjson rejects strings with lone surrogates (e.g. undecodable test
+            # output), which stdlib json escapes instead
+            return json.dumps(data, default=_encode_default).encode("utf-8")
+
+    def _loads(content: bytes) -> Any:
+        return orjson.loads(content)
+
+except ImportError:  # pragma: no cover - platforms without an orjson wheel
+
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, default=_encode_default).encode("utf-8")
+
+    def _loads(content: bytes) -> Any:
+        return json.loads(content)
+
+
+# Maximum number of requests in flight at once; the connection pool is sized to match
+MAX_CONCURRENT_REQUESTS = 8
+
+# JSON bodies larger than this (in bytes) are gzip-compressed when enabled
+COMPRESSION_THRESHOLD = 4096
+
+
+@functools.lru_cache(maxsize=None)
+def _retry_strategy(total: int) -> Retry:
+    """Build the retry policy for a retry count; shared by every session that uses it."""
+    return Retry(
+        total=total,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(["HEAD", "GET", "POST", "PUT", "DELETE", "OPTIONS", "TRACE"]),
+    )
+
+
 class APIError(Exception):
     """Custom exception for API errors."""
 
@@ -23,29 +79,59 @@ class QAStudioAPIClient:
     def __init__(self, config: ReporterConfig):
         """Initialize API client with configuration."""
         self.config = config
-        self.session = self._create_session()
+        # Logging is a no-op unless verbose, so non-verbose runs skip the print path
+        self._log: Callable[[str], None] = (
+            self._log_impl if config.verbose else lambda message: None
+        )
         self.base_url = sanitize_string(config.api_url) or ""
         self.api_key = sanitize_string(config.api_key) or ""
         self.project_id = sanitize_string(config.project_id) or ""
+        # Created on first request, so runs that never reach the API (e.g.
+        # --collect-only) skip session and adapter setup
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+        # Full URLs by API path, resolved on first use
+        self._urls: Dict[str, str] = {}
+
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session, created on first access."""
+        if self._session is None:
+            # Batches may be submitted from several threads at once
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
 
     def _create_session(self) -> requests.Session:
-        """Create requests session with retry logic."""
+        """Create requests session with retry logic and default headers."""
         session = requests.Session()
-
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=self.config.max_retries,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "POST", "PUT", "DELETE", "OPTIONS", "TRACE"],
+        session.headers.update(
+            {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+                "User-Agent": "qastudio-pytest/1.0.0",
+            }
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # One adapter serves both schemes
+        adapter = HTTPAdapter(
+            max_retries=_retry_strategy(self.config.max_retries),
+            pool_connections=MAX_CONCURRENT_REQUESTS,
+            pool_maxsize=MAX_CONCURRENT_REQUESTS,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
         return session
 
+    def _url(self, path: str) -> str:
+        """Resolve an API path to its full URL, caching the result."""
+        url = self._urls.get(path)
+        if url is None:
+            url = self._urls[path] = f"{self.base_url}{path}"
+        return url
+
     def _make_request(
         self,
         method: str,
@@ -66,12 +152,18 @@ class QAStudioAPIClient:
         Raises:
             APIError: If request fails
         """
-        url = f"{self.base_url}{path}"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "User-Agent": "qastudio-pytest/1.0.0",
-        }
+        url = self._url(path)
+        headers = None
+
+        try:
+            body = _dumps(json_data) if json_data is not None else None
+        except (TypeError, ValueError) as e:
+            raise APIError(400, f"Could not encode request body: {str(e)}")
+
+        # Level 1 is much faster than the default and still shrinks JSON several-fold
+        if body is not None and self.config.compress_payloads and len(body) > COMPRESSION_THRESHOLD:
+            body = gzip.compress(body, compresslevel=1)
+            headers = {"Content-Encoding": "gzip"}
 
         try:
             self._log(f"Making {method} request to {path}")
@@ -79,7 +171,7 @@ class QAStudioAPIClient:
             response = self.session.request(
                 method=method,
                 url=url,
-                json=json_data,
+                data=body,
                 headers=headers,
                 timeout=self.config.timeout,
             )
@@ -91,7 +183,7 @@ class QAStudioAPIClient:
 
             # Return JSON if present
             if response.content:
-                json_response: Dict[str, Any] = response.json()
+                json_response: Dict[str, Any] = _loads(response.content)
                 return json_response
             return {}
 
@@ -101,6 +193,8 @@ class QAStudioAPIClient:
             raise APIError(503, f"Connection error: {str(e)}")
         except requests.exceptions.RequestException as e:
             raise APIError(500, f"Request failed: {str(e)}")
+        except ValueError as e:
+            raise APIError(500, f"Invalid JSON response: {str(e)}")
 
     def create_test_run(
         self,
@@ -150,9 +244,10 @@ class QAStudioAPIClient:
         """
         self._log(f"Submitting {len(results)} test results to run {test_run_id}")
 
+        # TestResult objects are encoded in place by the serializer
         data = {
             "testRunId": test_run_id,
-            "results": [result.to_dict() for result in results],
+            "results": results,
         }
 
         response = self._make_request("POST", "/results", json_data=data)
@@ -255,7 +350,7 @@ class QAStudioAPIClient:
         Raises:
             APIError: If request fails
         """
-        url = f"{self.base_url}{path}"
+        url = self._url(path)
         last_error: Optional[Exception] = None
 
         for attempt in range(self.config.max_retries):
@@ -336,10 +431,9 @@ class QAStudioAPIClient:
 
         body = b"".join(body_parts)
 
+        # Overrides the session's JSON Content-Type for this request only
         headers = {
-            "Authorization": f"Bearer {self.api_key}",
             "Content-Type": f"multipart/form-data; boundary={boundary}",
-            "User-Agent": "qastudio-pytest/1.0.0",
         }
 
         try:
@@ -358,7 +452,7 @@ class QAStudioAPIClient:
 
             # Return JSON if present
             if response.content:
-                json_response: Dict[str, Any] = response.json()
+                json_response: Dict[str, Any] = _loads(response.content)
                 return json_response
             return {}
 
@@ -368,12 +462,14 @@ class QAStudioAPIClient:
             raise APIError(503, f"Connection error: {str(e)}")
         except requests.exceptions.RequestException as e:
             raise APIError(500, f"Request failed: {str(e)}")
+        except ValueError as e:
+            raise APIError(500, f"Invalid JSON response: {str(e)}")
 
-    def _log(self, message: str) -> None:
-        """Log message if verbose mode is enabled."""
-        if self.config.verbose:
-            print(f"[QAStudio] {message}")
+    def _log_impl(self, message: str) -> None:
+        """Print a log message (bound to ``_log`` in verbose mode)."""
+        print(f"[QAStudio] {message}")
 
     def close(self) -> None:
-        """Close the session."""
-        self.session.close()
+        """Close the session if one was created."""
+        if self._session is not None:
+            self._session.close()
@@ -200,6 +200,7 @@ class ReporterConfig:
     include_console_output: bool = False
     upload_attachments: bool = True
     attachments_dir: Optional[str] = None
+    compress_payloads: bool = True
 
     @classmethod
     def from_pytest_config(cls, config: Any) -> "ReporterConfig":
@@ -236,6 +237,11 @@ class ReporterConfig:
 
             return default
 
+        compress_payloads = get_option("qastudio_compress_payloads", True)
+        if isinstance(compress_payloads, str):
+            # pytest.ini values are strings; only an explicit "false" opts out
+            compress_payloads = compress_payloads.lower() not in ("false", "0", "no")
+
         return cls(
             api_url=get_option("qastudio_api_url", "https://qastudio.dev/api"),
             api_key=get_option("qastudio_api_key"),
@@ -256,4 +262,5 @@ class ReporterConfig:
             include_console_output=get_option("qastudio_include_console_output", False),
             upload_attachments=get_option("qastudio_upload_attachments", True),
             attachments_dir=get_option("qastudio_attachments_dir"),
+            compress_payloads=compress_payloads,
         )
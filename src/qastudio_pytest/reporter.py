@@ -0,0 +1,386 @@
+"""QAStudio reporter that collects pytest results and submits them to QAStudio.dev."""
+
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
+import pytest
+
+from .api_client import MAX_CONCURRENT_REQUESTS, APIError, QAStudioAPIClient
+from .models import ReporterConfig, TestResult, TestRunSummary
+from .utils import (
+    format_duration,
+    generate_test_run_name,
+)
+
+# Maps characters that are awkward in directory names (from parametrize ids) to "_"
+_NAME_TRANS = str.maketrans({"[": "_", "]": "_"})
+
+# Seconds a partial batch may wait for more results before it is submitted
+FLUSH_INTERVAL = 5.0
+
+
+class QAStudioPlugin:
+    """pytest plugin for reporting test results to QAStudio.dev."""
+
+    def __init__(self, config: ReporterConfig):
+        """Initialize the plugin with configuration."""
+        self.config = config
+        # Logging is a no-op unless verbose, so non-verbose runs skip the print path
+        self._log: Callable[[str], None] = (
+            self._log_impl if config.verbose else lambda message: None
+        )
+        self.api_client = QAStudioAPIClient(config)
+        self.test_run_id: Optional[str] = None
+        self.start_time: float = 0
+        self.session_duration: float = 0
+
+        # Number of tests per status value ("passed", "failed", ...)
+        self.status_counts: "Counter[str]" = Counter()
+
+        # Results are streamed to a background worker that submits them in batches
+        # while the remaining tests run. None on the queue tells the worker to stop.
+        self._pending: Dict[str, TestResult] = {}
+        # pytest.ini values arrive as strings
+        self._batch_size = max(int(config.batch_size), 1)
+        self._queue: "queue.Queue[Optional[TestResult]]" = queue.Queue()
+        self._worker = threading.Thread(
+            target=self._drain_loop, name="qastudio-reporter", daemon=True
+        )
+        self._executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+        self._futures: Dict["Future[None]", int] = {}
+        self._worker_error: Optional[Exception] = None
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionstart(self, session: Any) -> None:
+        """
+        Called before test session starts.
+
+        Creates a new test run in QAStudio.dev.
+        """
+        self.start_time = time.time()
+        self._log("QAStudio.dev Reporter initialized")
+        self._log(f"Environment: {self.config.environment}")
+
+        try:
+            if self.config.create_test_run and not self.config.test_run_id:
+                # Create new test run
+                test_run_name = self.config.test_run_name or generate_test_run_name()
+                response = self.api_client.create_test_run(
+                    name=test_run_name,
+                    description=self.config.test_run_description,
+                )
+                self.test_run_id = response.get("id")
+                self._log(f"Created test run: {self.test_run_id}")
+            else:
+                # Use existing test run ID
+                self.test_run_id = self.config.test_run_id
+                self._log(f"Using existing test run: {self.test_run_id}")
+
+        except APIError as e:
+            self._handle_error("Failed to create test run", e)
+
+        if self.test_run_id:
+            self._worker.start()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item: Any, call: Any) -> Any:
+        """
+        Called to create test report for each test phase.
+
+        The result is built from the 'call' phase (actual test execution) and
+        queued for submission once teardown has finished, so attachments
+        written by fixture teardown are picked up.
+        """
+        outcome = yield
+        report = outcome.get_result()
+
+        if report.when == "call":
+            try:
+                result = TestResult.from_pytest_report(item, report, self.config)
+                self._pending[item.nodeid] = result
+
+                status = result.status.value
+                self.status_counts[status] += 1
+
+                if self.config.verbose:
+                    self._log(f"Test completed: {item.name} - {status} ({result.duration:.2f}s)")
+
+            except Exception as e:
+                self._log(f"Error processing test result: {e}")
+
+        elif report.when == "teardown":
+            pending = self._pending.pop(item.nodeid, None)
+            if pending is not None and self._worker.is_alive():
+                try:
+                    if self.config.upload_attachments:
+                        pending.attachment_paths = self._collect_attachments(item)
+                        if self.config.verbose:
+                            self._log(
+                                f"Found {len(pending.attachment_paths)} attachment(s) "
+                                f"for {pending.title}"
+                            )
+                    self._queue.put(pending)
+                except Exception as e:
+                    self._log(f"Error queueing test result: {e}")
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session: Any) -> None:
+        """
+        Called after all tests have finished.
+
+        Submits results to QAStudio.dev and completes the test run.
+        """
+        self.session_duration = time.time() - self.start_time
+        counts = self.status_counts
+        summary = TestRunSummary(
+            total=sum(counts.values()),
+            passed=counts["passed"],
+            failed=counts["failed"],
+            skipped=counts["skipped"],
+            errors=counts["error"],
+            duration=self.session_duration,
+        )
+
+        self._log("Test session completed")
+        self._log(
+            f"Total: {summary.total}, "
+            f"Passed: {summary.passed}, "
+            f"Failed: {summary.failed}, "
+            f"Skipped: {summary.skipped}, "
+            f"Errors: {summary.errors}"
+        )
+        self._log(f"Duration: {format_duration(self.session_duration)}")
+
+        if not self.test_run_id:
+            self._log("No test run ID available, skipping result submission")
+            return
+
+        try:
+            # Wait for the remaining batches to be submitted
+            self._flush_results()
+
+            # Complete the test run
+            self.api_client.complete_test_run(self.test_run_id, summary)
+            self._log("Results submitted successfully to QAStudio.dev")
+
+        except APIError as e:
+            self._handle_error("Failed to submit results", e)
+        finally:
+            self._executor.shutdown(wait=True)
+            self.api_client.close()
+
+    def _flush_results(self) -> None:
+        """Stop the background worker and wait for all submitted batches."""
+        # Tests whose teardown never reported (e.g. an interrupted session) were
+        # already counted, so submit them too
+        if self._worker.is_alive():
+            for result in self._pending.values():
+                self._queue.put(result)
+        self._pending.clear()
+
+        self._queue.put(None)
+        self._worker.join()
+
+        if self._worker_error is not None:
+            self._handle_error(
+                "Result submission worker failed, unsent results were dropped",
+                self._worker_error,
+            )
+
+        if not self._futures:
+            self._log("No results to submit")
+            return
+
+        # One failed batch must not stop the others from being reported or the
+        # run from being completed
+        for future in as_completed(self._futures):
+            try:
+                future.result()
+            except Exception as e:
+                self._handle_error(f"Failed to submit batch {self._futures[future]}", e)
+
+    def _drain_loop(self) -> None:
+        """Run the submission worker, keeping any failure for the main thread to report."""
+        try:
+            self._drain_batches()
+        except Exception as e:
+            self._worker_error = e
+            self._log(f"Result submission worker stopped: {e}")
+
+    def _drain_batches(self) -> None:
+        """
+        Drain queued results and dispatch them in batches.
+
+        A batch is dispatched once it reaches ``batch_size`` or has waited
+        ``FLUSH_INTERVAL`` seconds. Runs until None is taken off the queue.
+        """
+        batch: List[TestResult] = []
+        deadline: Optional[float] = None
+
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                result = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._dispatch_batch(batch)
+                batch, deadline = [], None
+                continue
+
+            if result is None:
+                break
+
+            if not batch:
+                deadline = time.monotonic() + FLUSH_INTERVAL
+            batch.append(result)
+
+            if len(batch) >= self._batch_size:
+                self._dispatch_batch(batch)
+                batch, deadline = [], None
+
+        if batch:
+            self._dispatch_batch(batch)
+
+    def _dispatch_batch(self, batch: List[TestResult]) -> None:
+        """Hand a batch to the executor so its HTTP round trip overlaps the others."""
+        index = len(self._futures) + 1
+        future = self._executor.submit(self._submit_batch, index, batch)
+        self._futures[future] = index
+
+    def _submit_batch(self, index: int, batch: List[TestResult]) -> None:
+        """
+        Submit a single batch of results and upload its attachments.
+
+        Args:
+            index: 1-based batch number (for logging)
+            batch: Test results to submit
+
+        Raises:
+            APIError: If the batch submission fails
+        """
+        self._log(f"Submitting batch {index} ({len(batch)} results)")
+        response = self.api_client.submit_test_results(
+            self.test_run_id,  # type: ignore
+            batch,
+        )
+
+        # Store result IDs for attachment uploads
+        if response and "results" in response:
+            for j, result_data in enumerate(response["results"]):
+                if j < len(batch):
+                    batch[j].result_id = result_data.get("testResultId")
+
+        # Upload attachments if enabled
+        if self.config.upload_attachments:
+            for result in batch:
+                if result.result_id and result.attachment_paths:
+                    self._upload_attachments(result)
+
+    def _collect_attachments(self, item: Any) -> List[str]:
+        """
+        Collect attachment file paths for a test.
+
+        Looks for attachments in:
+        1. Custom attachments directory (if configured)
+        2. pytest-html plugin screenshots
+        3. Test fixtures that store attachment paths
+
+        Args:
+            item: pytest test item
+
+        Returns:
+            List of file paths to attach
+        """
+        import os
+        import glob
+
+        attachments: List[str] = []
+
+        # Check if test has attachment paths stored as attribute
+        # This is set by test fixtures (e.g., Playwright conftest)
+        if hasattr(item, "_qastudio_attachments"):
+            stored_attachments = getattr(item, "_qastudio_attachments", [])
+            if stored_attachments:
+                attachments.extend(stored_attachments)
+
+        # Check custom attachments directory
+        if self.config.attachments_dir:
+            test_name = item.name.translate(_NAME_TRANS)
+            attachment_dir = os.path.join(self.config.attachments_dir, test_name)
+
+            if os.path.exists(attachment_dir):
+                # Find common attachment types
+                patterns = [
+                    "*.png",
+                    "*.jpg",
+                    "*.jpeg",
+                    "*.gif",
+                    "*.mp4",
+                    "*.webm",
+                    "*.txt",
+                    "*.log",
+                    "*.zip",
+                ]
+                for pattern in patterns:
+                    files = glob.glob(os.path.join(attachment_dir, pattern))
+                    attachments.extend(files)
+
+        return attachments
+
+    def _upload_attachments(self, result: TestResult) -> None:
+        """
+        Upload attachments for a test result.
+
+        Args:
+            result: TestResult with attachment_paths and result_id
+        """
+        if not result.result_id or not result.attachment_paths:
+            return
+
+        self._log(f"Uploading {len(result.attachment_paths)} attachment(s) for {result.title}")
+
+        for file_path in result.attachment_paths:
+            try:
+                # Determine attachment type from file extension
+                import os
+
+                ext = os.path.splitext(file_path)[1].lower()
+                filename = os.path.basename(file_path)
+                attachment_type = None
+
+                if ext in [".png", ".jpg", ".jpeg", ".gif"]:
+                    attachment_type = "screenshot"
+                elif ext in [".mp4", ".webm", ".avi", ".mov"]:
+                    attachment_type = "video"
+                elif ext in [".log", ".txt"]:
+                    attachment_type = "log"
+                elif ext == ".zip" and "trace" in filename.lower():
+                    attachment_type = "trace"
+
+                self.api_client.upload_attachment(
+                    test_result_id=result.result_id,
+                    file_path=file_path,
+                    attachment_type=attachment_type,
+                )
+
+                self._log(f"  Uploaded: {os.path.basename(file_path)}")
+
+            except APIError as e:
+                self._handle_error(f"Failed to upload attachment {file_path}", e)
+            except Exception as e:
+                self._log(f"  Error uploading {file_path}: {e}")
+
+    def _log_impl(self, message: str) -> None:
+        """Print a log message (bound to ``_log`` in verbose mode)."""
+        print(f"[QAStudio] {message}")
+
+    def _handle_error(self, message: str, error: Exception) -> None:
+        """Handle errors based on silent mode."""
+        error_msg = f"{message}: {str(error)}"
+
+        if self.config.silent:
+            print(f"[QAStudio] ERROR: {error_msg}")
+        else:
+            raise Exception(error_msg) from error
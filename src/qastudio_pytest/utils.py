@@ -1,5 +1,6 @@
 """Utility functions for QAStudio pytest plugin."""
 
+import functools
 import re
 from datetime import datetime
 from typing import Any, List, Optional, TypeVar
@@ -115,8 +116,14 @@ def strip_ansi(text: str) -> str:
     return text.strip()
 
 
+@functools.lru_cache(maxsize=256)
 def sanitize_string(text: Optional[str]) -> Optional[str]:
-    """Sanitize string by removing ANSI codes."""
+    """
+    Sanitize string by removing ANSI codes.
+
+    Results are cached, so use this for short, repeated values such as config
+    strings; large one-off text (e.g. captured output) should use strip_ansi.
+    """
     if text is None:
         return None
     return strip_ansi(text)
@@ -238,21 +245,21 @@ def extract_console_output(report: Any) -> Optional[dict]:
     try:
         # Extract captured stdout
         if hasattr(report, "capstdout") and report.capstdout:
-            stdout = sanitize_string(report.capstdout)
+            stdout = strip_ansi(report.capstdout)
 
         # Extract captured stderr
         if hasattr(report, "capstderr") and report.capstderr:
-            stderr = sanitize_string(report.capstderr)
+            stderr = strip_ansi(report.capstderr)
 
         # Also try sections
         if hasattr(report, "sections"):
             for section_name, section_content in report.sections:
                 if "stdout" in section_name.lower():
-                    stdout_text = sanitize_string(section_content)
+                    stdout_text = strip_ansi(section_content)
                     if stdout_text:
                         stdout = stdout_text
                 elif "stderr" in section_name.lower():
-                    stderr_text = sanitize_string(section_content)
+                    stderr_text = strip_ansi(section_content)
                     if stderr_text:
                         stderr = stderr_text
 
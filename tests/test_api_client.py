@@ -0,0 +1,130 @@
+"""Tests for the QAStudio API client."""
+
+import gzip
+import json
+
+import pytest
+
+from qastudio_pytest import models
+from qastudio_pytest.api_client import (
+    COMPRESSION_THRESHOLD,
+    APIError,
+    QAStudioAPIClient,
+    _dumps,
+    _loads,
+)
+
+
+def make_result():
+    """Create a failed test result with every wire field populated."""
+    return models.TestResult(
+        test_case_id="QA-1",
+        title="test_login",
+        full_title="test_auth.py::test_login",
+        status=models.TestStatus.FAILED,
+        duration=1.5,
+        error="AssertionError",
+        stack_trace="Traceback ...",
+        file_path="test_auth.py",
+        attachment_paths=["/tmp/shot.png"],
+        metadata={"priority": "high"},
+        result_id="r-1",
+    )
+
+
+def test_dumps_encodes_test_results_via_to_dict():
+    """Test TestResult objects are serialized in the API wire format."""
+    result = make_result()
+
+    payload = _loads(_dumps({"testRunId": "run-1", "results": [result]}))
+
+    assert payload["results"][0] == result.to_dict()
+    assert payload["results"][0]["duration"] == 1500
+
+
+def test_dumps_escapes_lone_surrogates():
+    """Test strings orjson rejects (lone surrogates) are still encoded."""
+    result = make_result()
+    result.error = "bad \udcff"
+
+    payload = json.loads(_dumps({"results": [result]}))
+
+    assert payload["results"][0]["errorMessage"] == "bad \udcff"
+
+
+class MockResponse:
+    """Mock requests response."""
+
+    ok = True
+    content = b"{}"
+
+
+class MockSession:
+    """Mock requests session recording request arguments."""
+
+    def __init__(self):
+        self.calls = []
+
+    def request(self, **kwargs):
+        self.calls.append(kwargs)
+        return MockResponse()
+
+
+def make_client(compress_payloads=True):
+    """Create an API client with a mock session."""
+    config = models.ReporterConfig(
+        api_url="https://qastudio.dev/api",
+        api_key="key",
+        project_id="project",
+        compress_payloads=compress_payloads,
+    )
+    client = QAStudioAPIClient(config)
+    client._session = MockSession()
+    return client
+
+
+def test_make_request_compresses_large_payloads():
+    """Test bodies over the threshold are gzipped with a Content-Encoding header."""
+    client = make_client()
+    data = {"results": ["x" * COMPRESSION_THRESHOLD]}
+
+    client._make_request("POST", "/results", json_data=data)
+
+    call = client.session.calls[0]
+    assert call["headers"] == {"Content-Encoding": "gzip"}
+    assert _loads(gzip.decompress(call["data"])) == data
+
+
+def test_make_request_sends_small_payloads_uncompressed():
+    """Test bodies under the threshold are sent as plain JSON."""
+    client = make_client()
+    data = {"results": []}
+
+    client._make_request("POST", "/results", json_data=data)
+
+    call = client.session.calls[0]
+    assert call["headers"] is None
+    assert _loads(call["data"]) == data
+
+
+def test_make_request_compression_can_be_disabled():
+    """Test compress_payloads=False sends large payloads uncompressed."""
+    client = make_client(compress_payloads=False)
+    data = {"results": ["x" * COMPRESSION_THRESHOLD]}
+
+    client._make_request("POST", "/results", json_data=data)
+
+    call = client.session.calls[0]
+    assert call["headers"] is None
+    assert _loads(call["data"]) == data
+
+
+def test_make_request_wraps_encoding_errors():
+    """Test unserializable payloads raise APIError instead of escaping."""
+    client = make_client()
+
+    with pytest.raises(APIError) as exc_info:
+        client._make_request("POST", "/results", json_data={"results": [object()]})
+
+    assert exc_info.value.status_code == 400
+    assert client.session.calls == []
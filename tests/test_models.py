@@ -0,0 +1,35 @@
+"""Tests for data models."""
+
+import pytest
+
+from qastudio_pytest.models import ReporterConfig
+
+
+class MockConfig:
+    """Mock pytest config with ini values."""
+
+    def __init__(self, ini):
+        self._ini = ini
+
+    def getini(self, name):
+        return self._ini.get(name, "")
+
+    def getoption(self, name, default=None):
+        return default
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("false", False), ("False", False), ("0", False), ("true", True), ("1", True)],
+)
+def test_compress_payloads_from_ini(value, expected):
+    """Test the pytest.ini string value is parsed as a boolean."""
+    config = ReporterConfig.from_pytest_config(MockConfig({"qastudio_compress_payloads": value}))
+    assert config.compress_payloads is expected
+
+
+def test_compress_payloads_defaults_to_true(monkeypatch):
+    """Test compression is enabled when the option is not set."""
+    monkeypatch.delenv("QASTUDIO_COMPRESS_PAYLOADS", raising=False)
+    config = ReporterConfig.from_pytest_config(MockConfig({}))
+    assert config.compress_payloads is True
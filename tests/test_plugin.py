@@ -0,0 +1,237 @@
+"""Tests for the plugin's background result submission."""
+
+import subprocess
+import sys
+import time
+
+from qastudio_pytest import models
+from qastudio_pytest import reporter as reporter_module
+from qastudio_pytest.reporter import QAStudioPlugin
+
+
+def make_plugin(batch_size=10):
+    """Create a plugin whose API client records submitted batches."""
+    config = models.ReporterConfig(
+        api_url="https://qastudio.dev/api",
+        api_key="key",
+        project_id="project",
+        batch_size=batch_size,
+    )
+    plugin = QAStudioPlugin(config)
+    plugin.test_run_id = "run-1"
+    submitted = []
+
+    def submit_test_results(test_run_id, results):
+        submitted.append([result.title for result in results])
+        return {}
+
+    plugin.api_client.submit_test_results = submit_test_results
+    return plugin, submitted
+
+
+def make_result(i):
+    """Create a passing test result."""
+    return models.TestResult(
+        test_case_id=None,
+        title=f"test_{i}",
+        full_title=f"test_file.py::test_{i}",
+        status=models.TestStatus.PASSED,
+        duration=0.1,
+    )
+
+
+def test_flush_submits_full_batches_and_remainder():
+    """Test full batches are dispatched and the sentinel flushes the rest."""
+    plugin, submitted = make_plugin(batch_size=10)
+    plugin._worker.start()
+
+    for i in range(25):
+        plugin._queue.put(make_result(i))
+    plugin._flush_results()
+    plugin._executor.shutdown(wait=True)
+
+    assert not plugin._worker.is_alive()
+    assert sorted(len(batch) for batch in submitted) == [5, 10, 10]
+    assert sorted(title for batch in submitted for title in batch) == sorted(
+        f"test_{i}" for i in range(25)
+    )
+
+
+def test_partial_batch_is_flushed_after_interval(monkeypatch):
+    """Test a partial batch is submitted once FLUSH_INTERVAL has passed."""
+    monkeypatch.setattr(reporter_module, "FLUSH_INTERVAL", 0.05)
+    plugin, submitted = make_plugin(batch_size=10)
+    plugin._worker.start()
+
+    for i in range(3):
+        plugin._queue.put(make_result(i))
+
+    deadline = time.monotonic() + 5
+    while not submitted and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # Submitted by the interval, while the worker is still running
+    assert submitted == [["test_0", "test_1", "test_2"]]
+    assert plugin._worker.is_alive()
+
+    plugin._flush_results()
+    plugin._executor.shutdown(wait=True)
+
+    assert submitted == [["test_0", "test_1", "test_2"]]
+
+
+def test_flush_without_results_submits_nothing():
+    """Test the sentinel alone stops the worker without submitting."""
+    plugin, submitted = make_plugin()
+    plugin._worker.start()
+
+    plugin._flush_results()
+    plugin._executor.shutdown(wait=True)
+
+    assert not plugin._worker.is_alive()
+    assert submitted == []
+
+
+def test_worker_failure_is_reported(monkeypatch, capsys):
+    """Test an unexpected worker error is reported instead of silently dropped."""
+    plugin, submitted = make_plugin(batch_size=1)
+
+    def fail(batch):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(plugin, "_dispatch_batch", fail)
+    plugin._worker.start()
+
+    plugin._queue.put(make_result(0))
+    plugin._flush_results()
+    plugin._executor.shutdown(wait=True)
+
+    assert submitted == []
+    assert "Result submission worker failed" in capsys.readouterr().out
+
+
+def test_failed_batch_does_not_abort_flush(capsys):
+    """Test an unexpected error in one batch is reported and the rest still finish."""
+    plugin, submitted = make_plugin(batch_size=1)
+
+    def submit_test_results(test_run_id, results):
+        if results[0].title == "test_0":
+            raise RuntimeError("boom")
+        submitted.append([result.title for result in results])
+        return {}
+
+    plugin.api_client.submit_test_results = submit_test_results
+    plugin._worker.start()
+
+    for i in range(3):
+        plugin._queue.put(make_result(i))
+    plugin._flush_results()
+    plugin._executor.shutdown(wait=True)
+
+    assert sorted(submitted) == [["test_1"], ["test_2"]]
+    assert "Failed to submit batch 1: boom" in capsys.readouterr().out
+
+
+def test_flush_submits_results_without_teardown():
+    """Test results still waiting for their teardown report are submitted."""
+    plugin, submitted = make_plugin()
+    plugin._worker.start()
+
+    plugin._queue.put(make_result(0))
+    plugin._pending["test_file.py::test_1"] = make_result(1)
+    plugin._flush_results()
+    plugin._executor.shutdown(wait=True)
+
+    assert submitted == [["test_0", "test_1"]]
+    assert plugin._pending == {}
+
+
+def test_plugin_import_does_not_load_api_client():
+    """Importing the pytest entry point must not pull in the HTTP stack."""
+    code = (
+        "import sys, qastudio_pytest.plugin; "
+        "print('requests' in sys.modules, 'qastudio_pytest.api_client' in sys.modules)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.split() == ["False", "False"]
+
+
+class MockItem:
+    """Mock pytest item for driving the report hook."""
+
+    def __init__(self, name):
+        self.name = name
+        self.nodeid = f"test_file.py::{name}"
+        self.cls = None
+        self.function = type("obj", (object,), {"__doc__": None})
+
+    def get_closest_marker(self, name):
+        return None
+
+    def iter_markers(self):
+        return iter([])
+
+
+class MockReport:
+    """Mock pytest report for a single test phase."""
+
+    def __init__(self, when, outcome="passed"):
+        self.when = when
+        self.passed = outcome == "passed"
+        self.failed = outcome == "failed"
+        self.skipped = outcome == "skipped"
+        self.duration = 0.1
+        self.longrepr = None
+
+
+class MockOutcome:
+    """Mock hookwrapper outcome."""
+
+    def __init__(self, report):
+        self._report = report
+
+    def get_result(self):
+        return self._report
+
+
+def run_test_phases(plugin, item, outcome):
+    """Drive pytest_runtest_makereport through the call and teardown phases."""
+    for report in (MockReport("call", outcome), MockReport("teardown")):
+        hook = plugin.pytest_runtest_makereport(item, None)
+        next(hook)
+        try:
+            hook.send(MockOutcome(report))
+        except StopIteration:
+            pass
+
+
+def test_sessionfinish_completes_run_with_status_summary():
+    """Test the summary sent on completion reflects every reported status."""
+    plugin, submitted = make_plugin()
+    plugin.config.upload_attachments = False
+    completed = []
+    plugin.api_client.complete_test_run = lambda test_run_id, summary: completed.append(
+        (test_run_id, summary)
+    )
+    plugin._worker.start()
+
+    # A call report that is neither passed, failed nor skipped counts as an error
+    outcomes = ["passed", "passed", "passed", "failed", "failed", "skipped", "error"]
+    for i, outcome in enumerate(outcomes):
+        run_test_phases(plugin, MockItem(f"test_{i}"), outcome)
+    plugin.pytest_sessionfinish(None)
+
+    assert len(completed) == 1
+    test_run_id, summary = completed[0]
+    assert test_run_id == "run-1"
+    assert summary.total == 7
+    assert summary.passed == 3
+    assert summary.failed == 2
+    assert summary.skipped == 1
+    assert summary.errors == 1
+    assert sorted(title for batch in submitted for title in batch) == [
+        f"test_{i}" for i in range(7)
+    ]
@@ -146,3 +146,11 @@ def test_sanitize_string():
     assert sanitize_string("\x1b[31mtest\x1b[0m") == "test"
     assert sanitize_string("plain") == "plain"
     assert sanitize_string(None) is None
+
+
+def test_sanitize_string_is_cached():
+    """Test repeated sanitizing of the same string hits the cache."""
+    sanitize_string.cache_clear()
+    sanitize_string("\x1b[32mhttps://qastudio.dev/api\x1b[0m")
+    assert sanitize_string("\x1b[32mhttps://qastudio.dev/api\x1b[0m") == "https://qastudio.dev/api"
+    assert sanitize_string.cache_info().hits == 1